@@ -6,31 +6,68 @@ Sets up the development environment, installs dependencies,
 and configures the application for first use.
 """
 
+import io
 import os
 import sys
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_command(cmd, description):
-    """Run a command and handle errors."""
+# Per-thread output buffer for steps that run concurrently in run_steps
+_step_output = threading.local()
+
+
+class _StepStdout:
+    """stdout proxy that sends a worker thread's writes to its step buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        buffer = getattr(_step_output, "buffer", None)
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self):
+        if getattr(_step_output, "buffer", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def run_command(cmd, description, env=None):
+    """Run a command (given as an argument list) and handle errors."""
     print(f"\n{'='*50}")
     print(f"Setting up: {description}")
-    print(f"Command: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
+    print(f"Command: {' '.join(cmd)}")
     print(f"{'='*50}")
 
+    # Stream stdout straight through unless this step's output is being
+    # buffered; only stderr is kept for the failure report so large
+    # installs are not held in memory
+    capture = getattr(_step_output, "buffer", None) is not None
+    if not capture:
+        # The child writes to the inherited fd directly; flush our buffered
+        # banner first so it is not overtaken when stdout is a pipe
+        sys.stdout.flush()
+
     try:
         result = subprocess.run(
             cmd,
             check=True,
-            shell=isinstance(cmd, str),
-            capture_output=True,
-            text=True
+            stdout=subprocess.PIPE if capture else None,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=env
         )
-        print(f"✓ {description} completed successfully")
         if result.stdout:
-            print(f"Output: {result.stdout}")
+            print(result.stdout, end="")
+        print(f"✓ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
+        if e.stdout:
+            print(e.stdout, end="")
         print(f"✗ {description} failed")
         print(f"Error: {e.stderr}")
         return False
@@ -69,23 +106,31 @@ def install_dependencies():
     else:  # Unix-like
         python_exe = Path("venv/bin/python")
 
-    if not python_exe.exists():
+    if not python_exe.is_file():
         print(f"✗ Python executable not found: {python_exe}")
         return False
 
-    # Install base dependencies
-    if not run_command([str(python_exe), "-m", "pip", "install", "-r", "requirements.txt"], "base dependencies"):
-        return False
+    python_exe_str = os.fspath(python_exe)
 
-    # Install development dependencies
-    if not run_command([str(python_exe), "-m", "pip", "install", "-r", "requirements/dev.txt"], "development dependencies"):
-        return False
+    # Resolve base, development and editable package requirements in a
+    # single pip process so the resolver and wheel cache are shared
+    install_args = ["-r", "requirements.txt"]
+    if Path("requirements/dev.txt").exists():
+        install_args += ["-r", "requirements/dev.txt"]
+    else:
+        print("⚠️  requirements/dev.txt not found, skipping development dependencies")
+    install_args += ["-e", "."]
 
-    # Install the package in development mode
-    if not run_command([str(python_exe), "-m", "pip", "install", "-e", "."], "package in development mode"):
-        return False
+    # Let pip overlap wheel downloads; capped to avoid mirror rate limiting.
+    # Older pip versions ignore the unknown variable.
+    env = {**os.environ, "PIP_PARALLEL_DOWNLOADS": str(min(os.cpu_count() or 4, 8))}
 
-    return True
+    return run_command(
+        [python_exe_str, "-m", "pip", "install",
+         "--upgrade-strategy", "only-if-needed", *install_args],
+        "all dependencies",
+        env=env
+    )
 
 def setup_pre_commit():
     """Set up pre-commit hooks."""
@@ -106,8 +151,9 @@ def create_directories():
     ]
 
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
-        print(f"✓ Created directory: {directory}")
+        Path(directory).mkdir(parents=True, exist_ok=True)
+
+    print(f"✓ Created directories: {', '.join(directories)}")
 
     return True
 
@@ -178,6 +224,66 @@ def run_initial_validation():
         print(f"⚠️  Validation failed (expected for first-time setup): {e}")
         return True  # Don't fail setup for validation issues
 
+def run_step(step_name, step_func):
+    """Run a single setup step, returning True on success."""
+    try:
+        return bool(step_func())
+    except Exception as e:
+        print(f"✗ {step_name} failed with exception: {e}")
+        return False
+
+def run_step_buffered(step_name, step_func):
+    """Run a setup step with its output buffered; return (success, output)."""
+    _step_output.buffer = io.StringIO()
+    try:
+        return run_step(step_name, step_func), _step_output.buffer.getvalue()
+    finally:
+        del _step_output.buffer
+
+def run_steps(steps):
+    """Run setup steps in dependency order and return failed step names."""
+    completed = set()
+    failed_steps = []
+    pending = list(steps)
+
+    while pending:
+        ready = [step for step in pending if set(step[2]) <= completed]
+        if not ready:
+            # Unresolvable dependencies; report the remaining steps as failed
+            failed_steps.extend(step[0] for step in pending)
+            break
+        pending = [step for step in pending if step not in ready]
+
+        if len(ready) == 1:
+            step_name, step_func, _ = ready[0]
+            results = {step_name: run_step(step_name, step_func)}
+        else:
+            # Buffer each step's output and replay it in declaration order
+            # once all of them have finished, so logs do not interleave
+            stdout = sys.stdout
+            sys.stdout = _StepStdout(stdout)
+            try:
+                with ThreadPoolExecutor(max_workers=len(ready)) as executor:
+                    futures = {
+                        step_name: executor.submit(run_step_buffered, step_name, step_func)
+                        for step_name, step_func, _ in ready
+                    }
+            finally:
+                sys.stdout = stdout
+
+            results = {}
+            for step_name, _, _ in ready:
+                results[step_name], output = futures[step_name].result()
+                sys.stdout.write(output)
+
+        # Record failures in declaration order for a stable summary
+        for step_name, _, _ in ready:
+            if not results[step_name]:
+                failed_steps.append(step_name)
+            completed.add(step_name)
+
+    return failed_steps
+
 def main():
     """Main setup function."""
     print("Email Priority Manager Setup")
@@ -189,26 +295,23 @@ def main():
     script_dir = Path(__file__).parent
     os.chdir(script_dir)
 
-    # Setup steps
+    # Setup steps as (name, function, dependencies). Steps whose
+    # dependencies have all run are executed together; the ones after
+    # dependency installation touch disjoint resources and run in parallel.
     steps = [
-        ("Check Python version", check_python_version),
-        ("Create virtual environment", create_virtual_environment),
-        ("Install dependencies", install_dependencies),
-        ("Setup pre-commit hooks", setup_pre_commit),
-        ("Create directories", create_directories),
-        ("Create .env file", create_env_file),
-        ("Run initial validation", run_initial_validation),
+        ("Check Python version", check_python_version, ()),
+        ("Create virtual environment", create_virtual_environment,
+         ("Check Python version",)),
+        ("Install dependencies", install_dependencies,
+         ("Create virtual environment",)),
+        ("Setup pre-commit hooks", setup_pre_commit, ("Install dependencies",)),
+        ("Create directories", create_directories, ("Install dependencies",)),
+        ("Create .env file", create_env_file, ("Install dependencies",)),
+        ("Run initial validation", run_initial_validation,
+         ("Setup pre-commit hooks", "Create directories", "Create .env file")),
     ]
 
-    failed_steps = []
-
-    for step_name, step_func in steps:
-        try:
-            if not step_func():
-                failed_steps.append(step_name)
-        except Exception as e:
-            print(f"✗ {step_name} failed with exception: {e}")
-            failed_steps.append(step_name)
+    failed_steps = run_steps(steps)
 
     # Final summary
     print(f"\n{'='*50}")
@@ -9,7 +9,27 @@ __version__ = "0.1.0"
 __author__ = "Email Priority Manager Team"
 __email__ = "support@emailprioritymanager.com"
 
-from .config.settings import get_settings
-from .config.models import AppConfig
+__all__ = ["get_settings", "AppConfig", "__version__"]
 
-__all__ = ["get_settings", "AppConfig", "__version__"]
\ No newline at end of file
+# Public names resolved on first access so that importing the package (e.g.
+# for the CLI entry point) does not pull in pydantic, yaml and the config
+# modules up front.
+_LAZY_EXPORTS = {
+    "get_settings": ".config.settings",
+    "AppConfig": ".config.models",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -6,34 +6,32 @@ and system administration.
 """
 
 import click
+import logging
 import sys
 from pathlib import Path
 
-# Add the src directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Configuration and secrets pull in pydantic, PyYAML and cryptography, so
+# they are imported inside the commands that need them; ``--help`` and
+# usage errors never load them. The module logger is created directly for
+# the same reason (get_logger() would load settings at import time), but
+# like the package's other loggers it does not propagate to the root
+# console handler, which would mix log lines into command output.
+from email_priority_manager.utils.logger import configure_logging
 
-from email_priority_manager.config.settings import (
-    get_settings,
-    validate_configuration,
-    create_default_config_file
-)
-from email_priority_manager.config.secrets import (
-    setup_email_interactive,
-    setup_ai_interactive,
-    get_secrets_manager
-)
-from email_priority_manager.utils.logger import configure_logging, get_logger
-
-logger = get_logger(__name__)
+logger = logging.getLogger(__name__)
+logger.propagate = False
 
 
 @click.group()
-@click.option('--config-dir', '-c', default=None, help='Configuration directory')
+@click.option('--config-dir', '-c', default=None, type=click.Path(file_okay=False),
+              help='Configuration directory')
 @click.option('--debug', '-d', is_flag=True, help='Enable debug mode')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
 @click.pass_context
 def cli(ctx, config_dir, debug, verbose):
     """Email Priority Manager - AI-powered email management system."""
+    from email_priority_manager.config.settings import get_settings
+
     ctx.ensure_object(dict)
 
     # Initialize context
@@ -44,12 +42,12 @@ def cli(ctx, config_dir, debug, verbose):
     # Configure logging early
     try:
         settings = get_settings(config_dir)
+        ctx.obj['settings'] = settings
         if debug:
             settings.logging.level = "DEBUG"
         configure_logging(settings)
     except Exception:
         # Use basic logging if configuration fails
-        import logging
         logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
 
     logger.debug("CLI initialized", extra={
@@ -64,6 +62,15 @@ def cli(ctx, config_dir, debug, verbose):
 @click.pass_context
 def setup(ctx, create_default):
     """Interactive setup for Email Priority Manager."""
+    from email_priority_manager.config.settings import (
+        validate_configuration,
+        create_default_config_file
+    )
+    from email_priority_manager.config.secrets import (
+        setup_email_interactive,
+        setup_ai_interactive
+    )
+
     logger.info("Starting interactive setup")
 
     try:
@@ -98,7 +105,7 @@ def setup(ctx, create_default):
         click.echo("You can now run 'email-priority-manager --help' to see available commands.")
 
     except Exception as e:
-        logger.error("Setup failed", error=str(e))
+        logger.error("Setup failed: %s", e)
         click.echo(f"✗ Setup failed: {e}", err=True)
         sys.exit(1)
 
@@ -107,6 +114,8 @@ def setup(ctx, create_default):
 @click.pass_context
 def validate(ctx):
     """Validate current configuration."""
+    from email_priority_manager.config.settings import validate_configuration
+
     logger.info("Validating configuration")
 
     try:
@@ -118,7 +127,7 @@ def validate(ctx):
             sys.exit(1)
 
     except Exception as e:
-        logger.error("Configuration validation failed", error=str(e))
+        logger.error("Configuration validation failed: %s", e)
         click.echo(f"✗ Configuration validation failed: {e}", err=True)
         sys.exit(1)
 
@@ -127,49 +136,57 @@ def validate(ctx):
 @click.pass_context
 def status(ctx):
     """Show system status and configuration."""
+    from email_priority_manager.config.settings import get_settings
+    from email_priority_manager.config.secrets import get_secrets_manager
+
     logger.info("Checking system status")
 
     try:
         config_dir = ctx.obj.get('config_dir')
-        settings = get_settings(config_dir)
+        settings = ctx.obj.get('settings') or get_settings(config_dir)
 
-        click.echo("Email Priority Manager Status")
-        click.echo("=" * 40)
+        # Collect the report and write it once rather than echoing line by line
+        lines = [
+            "Email Priority Manager Status",
+            "=" * 40,
+        ]
 
         # Basic info
-        click.echo(f"Environment: {settings.environment}")
-        click.echo(f"Debug Mode: {settings.debug}")
-        click.echo(f"Version: {getattr(settings, 'version', '0.1.0')}")
+        lines.append(f"Environment: {settings.environment}")
+        lines.append(f"Debug Mode: {settings.debug}")
+        lines.append(f"Version: {getattr(settings, 'version', '0.1.0')}")
 
         # Configuration status
-        click.echo(f"\nConfiguration:")
-        click.echo(f"  Config Directory: {config_dir or 'default'}")
-        click.echo(f"  Data Directory: {settings.data_dir}")
-        click.echo(f"  Log Directory: {settings.log_dir}")
+        lines.append("\nConfiguration:")
+        lines.append(f"  Config Directory: {config_dir or 'default'}")
+        lines.append(f"  Data Directory: {settings.data_dir}")
+        lines.append(f"  Log Directory: {settings.log_dir}")
 
         # Database status
         db_path = Path(settings.database.path)
         db_exists = db_path.exists()
-        click.echo(f"  Database: {settings.database.path} ({'✓' if db_exists else '✗'})")
+        lines.append(f"  Database: {settings.database.path} ({'✓' if db_exists else '✗'})")
 
         # Email configuration
         email_configured = bool(settings.email)
-        click.echo(f"  Email Configured: {'✓' if email_configured else '✗'}")
+        lines.append(f"  Email Configured: {'✓' if email_configured else '✗'}")
 
         # AI configuration
         ai_configured = bool(settings.ai)
-        click.echo(f"  AI Configured: {'✓' if ai_configured else '✗'}")
+        lines.append(f"  AI Configured: {'✓' if ai_configured else '✗'}")
 
         # Secrets status
         try:
             secrets_manager = get_secrets_manager()
             secrets_count = len(secrets_manager.list_secrets())
-            click.echo(f"  Secrets Stored: {secrets_count}")
+            lines.append(f"  Secrets Stored: {secrets_count}")
         except Exception:
-            click.echo("  Secrets: ✗")
+            lines.append("  Secrets: ✗")
+
+        click.echo("\n".join(lines))
 
     except Exception as e:
-        logger.error("Status check failed", error=str(e))
+        logger.error("Status check failed: %s", e)
         click.echo(f"✗ Status check failed: {e}", err=True)
         sys.exit(1)
 
@@ -185,6 +202,8 @@ def config():
 @click.pass_context
 def list_secrets(ctx, category):
     """List stored secrets."""
+    from email_priority_manager.config.secrets import get_secrets_manager
+
     logger.info("Listing secrets")
 
     try:
@@ -204,7 +223,7 @@ def list_secrets(ctx, category):
                 click.echo(f"  - {key}")
 
     except Exception as e:
-        logger.error("Failed to list secrets", error=str(e))
+        logger.error("Failed to list secrets: %s", e)
         click.echo(f"✗ Failed to list secrets: {e}", err=True)
         sys.exit(1)
 
@@ -216,7 +235,9 @@ def list_secrets(ctx, category):
 @click.pass_context
 def store_secret(ctx, key, value, category):
     """Store a secret."""
-    logger.info(f"Storing secret: {key}")
+    from email_priority_manager.config.secrets import get_secrets_manager
+
+    logger.info("Storing secret: %s", key)
 
     try:
         secrets_manager = get_secrets_manager()
@@ -224,7 +245,7 @@ def store_secret(ctx, key, value, category):
         click.echo(f"✓ Secret '{key}' stored in category '{category}'")
 
     except Exception as e:
-        logger.error("Failed to store secret", error=str(e))
+        logger.error("Failed to store secret: %s", e)
         click.echo(f"✗ Failed to store secret: {e}", err=True)
         sys.exit(1)
 
@@ -235,7 +256,9 @@ def store_secret(ctx, key, value, category):
 @click.pass_context
 def delete_secret(ctx, key, category):
     """Delete a secret."""
-    logger.info(f"Deleting secret: {key}")
+    from email_priority_manager.config.secrets import get_secrets_manager
+
+    logger.info("Deleting secret: %s", key)
 
     try:
         secrets_manager = get_secrets_manager()
@@ -243,7 +266,7 @@ def delete_secret(ctx, key, category):
         click.echo(f"✓ Secret '{key}' deleted from category '{category}'")
 
     except Exception as e:
-        logger.error("Failed to delete secret", error=str(e))
+        logger.error("Failed to delete secret: %s", e)
         click.echo(f"✗ Failed to delete secret: {e}", err=True)
         sys.exit(1)
 
@@ -258,21 +281,29 @@ def test():
 def unit():
     """Run unit tests."""
     logger.info("Running unit tests")
-    os.system("pytest tests/unit/ -v")
+    import pytest
+    sys.exit(pytest.main(["tests/unit/", "-v"]))
 
 
 @test.command()
 def integration():
     """Run integration tests."""
     logger.info("Running integration tests")
-    os.system("pytest tests/integration/ -v")
+    import pytest
+    sys.exit(pytest.main(["tests/integration/", "-v"]))
 
 
 @test.command()
 def all():
     """Run all tests."""
     logger.info("Running all tests")
-    os.system("pytest tests/ -v --cov=src/email_priority_manager")
+    # Coverage must start before the package is imported, which the CLI has
+    # already done, so run pytest in a fresh interpreter
+    import subprocess
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "tests/", "-v", "--cov=src/email_priority_manager"]
+    )
+    sys.exit(result.returncode)
 
 
 def main():
@@ -283,7 +314,7 @@ def main():
         click.echo("\nOperation cancelled by user")
         sys.exit(1)
     except Exception as e:
-        logger.error("Unexpected error", error=str(e))
+        logger.error("Unexpected error: %s", e)
         click.echo(f"✗ Unexpected error: {e}", err=True)
         sys.exit(1)
 
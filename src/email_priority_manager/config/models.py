@@ -190,7 +190,9 @@ class AppConfig(BaseSettings):
         ]
 
         for directory in directories:
-            if directory and not os.path.exists(directory):
+            if directory:
+                # makedirs already tolerates existing paths; a separate
+                # exists() check would only add a stat call per directory
                 os.makedirs(directory, exist_ok=True)
 
     @validator('environment')
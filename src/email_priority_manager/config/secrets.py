@@ -6,18 +6,20 @@ and API keys using industry-standard security practices.
 """
 
 import os
+import copy
 import json
 import base64
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from typing import Optional, Dict, Any, Union, TYPE_CHECKING
 import hashlib
 import secrets
+from functools import lru_cache
 
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
 logger = get_logger(__name__)
 
 
@@ -30,11 +32,18 @@ class SecretsManager:
         self.secrets_dir.mkdir(parents=True, exist_ok=True)
         self._key_file = self.secrets_dir / "key.key"
         self._secrets_file = self.secrets_dir / "secrets.enc"
-        self._fernet: Optional[Fernet] = None
+        self._fernet: Optional["Fernet"] = None
+        # Decrypted secrets keyed by the secrets file's mtime, so repeated
+        # reads skip the Fernet round-trip until the file changes
+        self._secrets_cache: Optional[tuple] = None
         self._init_encryption()
 
     def _init_encryption(self):
         """Initialize encryption key and Fernet instance."""
+        # Imported here so CLI paths that never touch secrets (e.g. --help)
+        # do not pay for loading the cryptography package
+        from cryptography.fernet import Fernet
+
         try:
             # Try to load existing key
             if self._key_file.exists():
@@ -59,13 +68,7 @@ class SecretsManager:
             salt = secrets.token_bytes(16)
 
             # Derive key using PBKDF2
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(passphrase.encode()))
+            key = self._derive_key(passphrase, salt)
 
             # Save salt with key
             key_data = {
@@ -97,13 +100,7 @@ class SecretsManager:
 
             # Derive key using stored salt
             salt = base64.b64decode(key_data['salt'])
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(passphrase.encode()))
+            key = self._derive_key(passphrase, salt)
 
             # Verify key matches
             if key.encode() != key_data['key'].encode():
@@ -115,6 +112,20 @@ class SecretsManager:
             logger.error(f"Failed to load encryption key: {e}")
             raise SecretsError(f"Key loading failed: {e}")
 
+    @staticmethod
+    def _derive_key(passphrase: str, salt: bytes) -> bytes:
+        """Derive a Fernet key from passphrase and salt using PBKDF2."""
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=100000,
+        )
+        return base64.urlsafe_b64encode(kdf.derive(passphrase.encode()))
+
     def _get_passphrase(self) -> str:
         """Get passphrase for key derivation."""
         # Try environment variable first
@@ -202,9 +213,14 @@ class SecretsManager:
 
     def _load_secrets_data(self) -> Dict[str, Any]:
         """Load encrypted secrets data."""
-        if not self._secrets_file.exists():
+        try:
+            mtime = self._secrets_file.stat().st_mtime_ns
+        except FileNotFoundError:
             return {}
 
+        if self._secrets_cache is not None and self._secrets_cache[0] == mtime:
+            return copy.deepcopy(self._secrets_cache[1])
+
         try:
             with open(self._secrets_file, 'r') as f:
                 encrypted_data = f.read()
@@ -213,7 +229,9 @@ class SecretsManager:
                 return {}
 
             decrypted_data = self._fernet.decrypt(encrypted_data.encode())
-            return json.loads(decrypted_data.decode())
+            data = json.loads(decrypted_data.decode())
+            self._secrets_cache = (mtime, data)
+            return copy.deepcopy(data)
 
         except Exception as e:
             logger.error(f"Failed to load secrets data: {e}")
@@ -222,16 +240,21 @@ class SecretsManager:
     def _save_secrets_data(self, data: Dict[str, Any]):
         """Save encrypted secrets data."""
         try:
-            json_data = json.dumps(data, indent=2)
+            # The payload is encrypted, so skip indentation and write the
+            # Fernet token bytes directly rather than round-tripping via str
+            json_data = json.dumps(data, separators=(',', ':'))
             encrypted_data = self._fernet.encrypt(json_data.encode())
 
-            with open(self._secrets_file, 'w') as f:
-                f.write(encrypted_data.decode())
+            with open(self._secrets_file, 'wb') as f:
+                f.write(encrypted_data)
 
             # Secure the secrets file
             os.chmod(self._secrets_file, 0o600)
 
+            self._secrets_cache = (self._secrets_file.stat().st_mtime_ns, copy.deepcopy(data))
+
         except Exception as e:
+            self._secrets_cache = None
             logger.error(f"Failed to save secrets data: {e}")
             raise SecretsError(f"Failed to save secrets data: {e}")
 
@@ -407,8 +430,9 @@ class SecretsError(Exception):
 
 
 # Utility functions for secret management
+@lru_cache()
 def get_secrets_manager(secrets_dir: Optional[str] = None) -> SecretsManager:
-    """Get secrets manager instance."""
+    """Get cached secrets manager instance."""
     return SecretsManager(secrets_dir)
 
 
@@ -417,8 +441,7 @@ def setup_email_interactive() -> bool:
     try:
         import getpass
 
-        print("Email Configuration Setup")
-        print("=" * 30)
+        print("Email Configuration Setup\n" + "=" * 30)
 
         server = input("SMTP Server: ").strip()
         if not server:
@@ -455,8 +478,7 @@ def setup_ai_interactive() -> bool:
     try:
         import getpass
 
-        print("AI Service Configuration Setup")
-        print("=" * 30)
+        print("AI Service Configuration Setup\n" + "=" * 30)
 
         api_key = getpass.getpass("BigModel.cn API Key: ")
         if not api_key:
@@ -6,8 +6,8 @@ with environment variable support and secure credential handling.
 """
 
 import os
+import copy
 import json
-import yaml
 from pathlib import Path
 from typing import Optional, Dict, Any, Union
 from functools import lru_cache
@@ -29,6 +29,18 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _default_config() -> Dict[str, Any]:
+    """Build default configuration values once per process."""
+    return {
+        "debug": False,
+        "environment": "development",
+        "database": DatabaseConfig().dict(),
+        "processing": ProcessingConfig().dict(),
+        "logging": LoggingConfig().dict(),
+    }
+
+
 class ConfigManager:
     """Manages application configuration loading and validation."""
 
@@ -50,12 +62,12 @@ class ConfigManager:
             # Create configuration object
             self._config = AppConfig(**config_data)
 
-            logger.info("Configuration loaded successfully",
-                       environment=self._config.environment)
+            logger.info("Configuration loaded successfully (environment: %s)",
+                        self._config.environment)
             return self._config
 
         except Exception as e:
-            logger.error("Failed to load configuration", error=str(e))
+            logger.error("Failed to load configuration: %s", e)
             raise ConfigurationError(f"Configuration loading failed: {e}")
 
     def _load_config_sources(self) -> Dict[str, Any]:
@@ -80,16 +92,14 @@ class ConfigManager:
 
     def _load_default_config(self) -> Dict[str, Any]:
         """Load default configuration values."""
-        return {
-            "debug": False,
-            "environment": "development",
-            "database": DatabaseConfig().dict(),
-            "processing": ProcessingConfig().dict(),
-            "logging": LoggingConfig().dict(),
-        }
+        return copy.deepcopy(_default_config())
 
     def _load_config_files(self) -> Dict[str, Any]:
         """Load configuration from files."""
+        # Deferred so that CLI paths which never load configuration
+        # (e.g. --help) do not pay for importing PyYAML
+        import yaml
+
         config_data = {}
 
         # Check for YAML config files
@@ -99,28 +109,32 @@ class ConfigManager:
             self.config_dir / f"{os.getenv('EPM_ENVIRONMENT', 'development')}.yaml",
         ]
 
+        # Missing files are the common case, so open directly and treat
+        # FileNotFoundError as "not present" instead of stat-ing first
         for yaml_file in yaml_files:
-            if yaml_file.exists():
-                try:
-                    with open(yaml_file, 'r', encoding='utf-8') as f:
-                        file_data = yaml.safe_load(f)
-                        if file_data:
-                            config_data.update(file_data)
-                            logger.debug(f"Loaded config from {yaml_file}")
-                except Exception as e:
-                    logger.warning(f"Failed to load config from {yaml_file}: {e}")
-
-        # Check for JSON config file
-        json_file = self.config_dir / "config.json"
-        if json_file.exists():
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    file_data = json.load(f)
+                with open(yaml_file, 'r', encoding='utf-8') as f:
+                    file_data = yaml.safe_load(f)
                     if file_data:
                         config_data.update(file_data)
-                        logger.debug(f"Loaded config from {json_file}")
+                        logger.debug("Loaded config from %s", yaml_file)
+            except FileNotFoundError:
+                continue
             except Exception as e:
-                logger.warning(f"Failed to load config from {json_file}: {e}")
+                logger.warning("Failed to load config from %s: %s", yaml_file, e)
+
+        # Check for JSON config file
+        json_file = self.config_dir / "config.json"
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                file_data = json.load(f)
+                if file_data:
+                    config_data.update(file_data)
+                    logger.debug("Loaded config from %s", json_file)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Failed to load config from %s: %s", json_file, e)
 
         return config_data
 
@@ -140,7 +154,7 @@ class ConfigManager:
                 secrets_data["ai"] = ai_secrets
 
         except Exception as e:
-            logger.warning(f"Failed to load secrets: {e}")
+            logger.warning("Failed to load secrets: %s", e)
 
         return secrets_data
 
@@ -157,6 +171,8 @@ class ConfigManager:
 
     def save_config(self, config: AppConfig, config_file: str = "local.yaml"):
         """Save configuration to file."""
+        import yaml
+
         try:
             config_path = self.config_dir / config_file
             self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -165,10 +181,10 @@ class ConfigManager:
                 yaml.safe_dump(config.dict(exclude={'email': {'password'}, 'ai': {'api_key'}}),
                               f, default_flow_style=False, indent=2)
 
-            logger.info(f"Configuration saved to {config_path}")
+            logger.info("Configuration saved to %s", config_path)
 
         except Exception as e:
-            logger.error(f"Failed to save configuration: {e}")
+            logger.error("Failed to save configuration: %s", e)
             raise ConfigurationError(f"Failed to save configuration: {e}")
 
 
@@ -202,6 +218,8 @@ def get_ai_settings() -> AISettings:
 
 def create_default_config_file(config_dir: str = "config"):
     """Create default configuration file."""
+    import yaml
+
     config_path = Path(config_dir)
     config_path.mkdir(parents=True, exist_ok=True)
 
@@ -237,7 +255,7 @@ def create_default_config_file(config_dir: str = "config"):
     with open(config_file, 'w', encoding='utf-8') as f:
         yaml.safe_dump(default_config, f, default_flow_style=False, indent=2)
 
-    logger.info(f"Default configuration created at {config_file}")
+    logger.info("Default configuration created at %s", config_file)
 
 
 def validate_configuration() -> bool:
@@ -254,18 +272,18 @@ def validate_configuration() -> bool:
 
         # Test database connectivity
         db_url = settings.get_database_url()
-        logger.debug(f"Database URL: {db_url}")
+        logger.debug("Database URL: %s", db_url)
 
         # Test configuration paths
         for directory in [settings.data_dir, settings.log_dir, settings.temp_dir]:
-            if directory and not os.path.exists(directory):
+            if directory:
                 os.makedirs(directory, exist_ok=True)
 
         logger.info("Configuration validation successful")
         return True
 
     except Exception as e:
-        logger.error(f"Configuration validation failed: {e}")
+        logger.error("Configuration validation failed: %s", e)
         return False
 
 
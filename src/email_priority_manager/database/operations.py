@@ -986,31 +986,31 @@ class DatabaseOperations:
             stats = {}
             with self.db_manager.get_cursor() as cursor:
 
-                # Email statistics
-                cursor.execute("SELECT COUNT(*) FROM emails")
-                stats['total_emails'] = cursor.fetchone()[0]
-
-                cursor.execute("SELECT COUNT(*) FROM emails WHERE has_attachments = 1")
-                stats['emails_with_attachments'] = cursor.fetchone()[0]
-
-                cursor.execute("SELECT COUNT(*) FROM emails WHERE is_read = 0")
-                stats['unread_emails'] = cursor.fetchone()[0]
+                # Email statistics (single pass over emails)
+                cursor.execute("""
+                    SELECT
+                        COUNT(*),
+                        COALESCE(SUM(has_attachments = 1), 0),
+                        COALESCE(SUM(is_read = 0), 0)
+                    FROM emails
+                """)
+                (
+                    stats['total_emails'],
+                    stats['emails_with_attachments'],
+                    stats['unread_emails'],
+                ) = cursor.fetchone()
 
                 # Attachment statistics
-                cursor.execute("SELECT COUNT(*) FROM attachments")
-                stats['total_attachments'] = cursor.fetchone()[0]
-
-                cursor.execute("SELECT SUM(size_bytes) FROM attachments")
-                result = cursor.fetchone()[0]
-                stats['total_attachment_size'] = result if result else 0
+                cursor.execute("SELECT COUNT(*), SUM(size_bytes) FROM attachments")
+                total_attachments, total_size = cursor.fetchone()
+                stats['total_attachments'] = total_attachments
+                stats['total_attachment_size'] = total_size if total_size else 0
 
                 # Classification statistics
-                cursor.execute("SELECT COUNT(*) FROM classifications")
-                stats['classified_emails'] = cursor.fetchone()[0]
-
-                cursor.execute("SELECT AVG(priority_score) FROM classifications")
-                result = cursor.fetchone()[0]
-                stats['average_priority'] = round(result, 2) if result else 0
+                cursor.execute("SELECT COUNT(*), AVG(priority_score) FROM classifications")
+                classified_emails, average_priority = cursor.fetchone()
+                stats['classified_emails'] = classified_emails
+                stats['average_priority'] = round(average_priority, 2) if average_priority else 0
 
                 cursor.execute("SELECT urgency_level, COUNT(*) FROM classifications GROUP BY urgency_level")
                 stats['urgency_distribution'] = dict(cursor.fetchall())
@@ -3,7 +3,8 @@ Complex query functions for email retrieval and analysis.
 """
 
 import sqlite3
-from typing import List, Dict, Any, Optional, Tuple, Union
+from contextlib import closing, contextmanager
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterator
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from enum import Enum
@@ -107,6 +108,14 @@ class EmailQueries:
     def __init__(self, db_path: str = "email_priority.db"):
         self.db_path = db_path
 
+    @contextmanager
+    def _get_connection(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one call; commit on success and always close it."""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.row_factory = sqlite3.Row
+            with conn:
+                yield conn
+
     def get_emails_by_priority(
         self,
         min_priority: int = 1,
@@ -129,8 +138,7 @@ class EmailQueries:
         if options is None:
             options = QueryOptions()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             # Build main query
@@ -198,8 +206,7 @@ class EmailQueries:
         if options is None:
             options = QueryOptions()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             # Build main query
@@ -257,8 +264,7 @@ class EmailQueries:
         Returns:
             Detailed email information or None if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             # Get email basic info
@@ -323,8 +329,7 @@ class EmailQueries:
         if options is None:
             options = QueryOptions()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             # Build query
@@ -387,8 +392,7 @@ class EmailQueries:
         if options is None:
             options = QueryOptions()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             # Build query
@@ -443,12 +447,27 @@ class EmailQueries:
         Returns:
             Dictionary with email statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Total emails
-            cursor.execute("SELECT COUNT(*) FROM emails")
-            total_emails = cursor.fetchone()[0]
+            # Email counters, aggregated in a single pass over the emails table
+            week_ago = (datetime.now() - timedelta(days=7)).isoformat()
+            cursor.execute("""
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(has_attachments = 1), 0),
+                    COALESCE(SUM(is_read = 0), 0),
+                    COALESCE(SUM(is_flagged = 1), 0),
+                    COALESCE(SUM(received_at >= ?), 0)
+                FROM emails
+            """, (week_ago,))
+            (
+                total_emails,
+                emails_with_attachments,
+                unread_emails,
+                flagged_emails,
+                recent_emails,
+            ) = cursor.fetchone()
 
             # Emails by priority
             cursor.execute("""
@@ -467,23 +486,6 @@ class EmailQueries:
             """)
             urgency_stats = {row[0]: row[1] for row in cursor.fetchall()}
 
-            # Emails with attachments
-            cursor.execute("SELECT COUNT(*) FROM emails WHERE has_attachments = 1")
-            emails_with_attachments = cursor.fetchone()[0]
-
-            # Unread emails
-            cursor.execute("SELECT COUNT(*) FROM emails WHERE is_read = 0")
-            unread_emails = cursor.fetchone()[0]
-
-            # Flagged emails
-            cursor.execute("SELECT COUNT(*) FROM emails WHERE is_flagged = 1")
-            flagged_emails = cursor.fetchone()[0]
-
-            # Recent emails (last 7 days)
-            week_ago = (datetime.now() - timedelta(days=7)).isoformat()
-            cursor.execute("SELECT COUNT(*) FROM emails WHERE received_at >= ?", (week_ago,))
-            recent_emails = cursor.fetchone()[0]
-
             return {
                 "total_emails": total_emails,
                 "priority_distribution": priority_stats,
@@ -506,7 +508,7 @@ class EmailQueries:
         Returns:
             List of sender statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -594,7 +596,7 @@ class EmailQueries:
         filters: Optional[List[QueryFilter]] = None
     ) -> int:
         """Get count of emails by priority range."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             query = """
@@ -619,7 +621,7 @@ class EmailQueries:
         filters: Optional[List[QueryFilter]] = None
     ) -> int:
         """Get count of emails by urgency levels."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             query = f"""
@@ -640,7 +642,7 @@ class EmailQueries:
 
     def _get_sender_email_count(self, sender: str, partial_match: bool) -> int:
         """Get count of emails by sender."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             if partial_match:
@@ -660,7 +662,7 @@ class EmailQueries:
         filters: Optional[List[QueryFilter]] = None
     ) -> int:
         """Get count of emails by date range."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             query = """
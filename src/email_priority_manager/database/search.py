@@ -3,7 +3,8 @@ Full-text search implementation for the email priority manager.
 """
 
 import sqlite3
-from typing import List, Dict, Any, Optional, Tuple
+from contextlib import closing, contextmanager
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass
 from enum import Enum
 
@@ -24,6 +25,20 @@ class SearchOperator(Enum):
     NOT = "NOT"
 
 
+# FTS columns searched for each scope; unknown scopes search everything
+_ALL_FTS_COLUMNS = ("subject", "sender", "recipients", "body_text")
+_FTS_COLUMNS_BY_SCOPE = {
+    SearchScope.ALL: _ALL_FTS_COLUMNS,
+    SearchScope.SUBJECT: ("subject",),
+    SearchScope.SENDER: ("sender",),
+    SearchScope.RECIPIENTS: ("recipients",),
+    SearchScope.BODY: ("body_text",),
+}
+
+# Comparison operators accepted in search filters
+_FILTER_OPERATORS = frozenset({"=", "LIKE", ">", "<", ">=", "<="})
+
+
 @dataclass
 class SearchFilter:
     """Search filter configuration."""
@@ -52,6 +67,14 @@ class EmailSearch:
     def __init__(self, db_path: str = "email_priority.db"):
         self.db_path = db_path
 
+    @contextmanager
+    def _get_connection(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one call; commit on success and always close it."""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.row_factory = sqlite3.Row
+            with conn:
+                yield conn
+
     def search(
         self,
         query: str,
@@ -75,8 +98,7 @@ class EmailSearch:
         Returns:
             List of search results
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             # Build FTS query based on scope
@@ -110,8 +132,7 @@ class EmailSearch:
         Returns:
             List of search results
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             sql = """
@@ -158,8 +179,7 @@ class EmailSearch:
         Returns:
             List of search results
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             if include_body_search:
@@ -210,8 +230,7 @@ class EmailSearch:
         Returns:
             List of search results
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             sql = """
@@ -246,7 +265,7 @@ class EmailSearch:
         Returns:
             List of suggestion dictionaries
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             # Get subject suggestions
@@ -281,18 +300,7 @@ class EmailSearch:
 
     def _get_fts_columns(self, scope: SearchScope) -> List[str]:
         """Get FTS columns based on search scope."""
-        if scope == SearchScope.ALL:
-            return ["subject", "sender", "recipients", "body_text"]
-        elif scope == SearchScope.SUBJECT:
-            return ["subject"]
-        elif scope == SearchScope.SENDER:
-            return ["sender"]
-        elif scope == SearchScope.RECIPIENTS:
-            return ["recipients"]
-        elif scope == SearchScope.BODY:
-            return ["body_text"]
-        else:
-            return ["subject", "sender", "recipients", "body_text"]
+        return list(_FTS_COLUMNS_BY_SCOPE.get(scope, _ALL_FTS_COLUMNS))
 
     def _build_fts_query(
         self,
@@ -336,7 +344,8 @@ class EmailSearch:
         offset: int
     ) -> Tuple[str, List[Any]]:
         """Build the complete search query with filters."""
-        sql = """
+        # Collect SQL fragments and join once instead of growing a string
+        sql_parts = ["""
             SELECT
                 e.id, e.message_id, e.subject, e.sender, e.recipients,
                 e.body_text, e.received_at,
@@ -344,32 +353,22 @@ class EmailSearch:
             FROM emails e
             LEFT JOIN email_fts ON e.id = email_fts.rowid
             WHERE email_fts MATCH ?
-        """
+        """]
 
         params = [fts_query]
 
         # Add filters
         if filters:
             for filter_obj in filters:
-                if filter_obj.operator == "=":
-                    sql += f" AND e.{filter_obj.field} = ?"
-                elif filter_obj.operator == "LIKE":
-                    sql += f" AND e.{filter_obj.field} LIKE ?"
-                elif filter_obj.operator == ">":
-                    sql += f" AND e.{filter_obj.field} > ?"
-                elif filter_obj.operator == "<":
-                    sql += f" AND e.{filter_obj.field} < ?"
-                elif filter_obj.operator == ">=":
-                    sql += f" AND e.{filter_obj.field} >= ?"
-                elif filter_obj.operator == "<=":
-                    sql += f" AND e.{filter_obj.field} <= ?"
+                if filter_obj.operator in _FILTER_OPERATORS:
+                    sql_parts.append(f" AND e.{filter_obj.field} {filter_obj.operator} ?")
 
                 params.append(filter_obj.value)
 
-        sql += " ORDER BY email_fts.rank DESC, e.received_at DESC LIMIT ? OFFSET ?"
+        sql_parts.append(" ORDER BY email_fts.rank DESC, e.received_at DESC LIMIT ? OFFSET ?")
         params.extend([limit, offset])
 
-        return sql, params
+        return "".join(sql_parts), params
 
     def _row_to_search_result(self, row: sqlite3.Row) -> SearchResult:
         """Convert database row to SearchResult."""
@@ -398,7 +397,7 @@ class EmailSearch:
 
     def rebuild_fts_index(self) -> None:
         """Rebuild the full-text search index."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
 
             # Rebuild FTS index
@@ -5,15 +5,14 @@ Provides structured logging with configurable levels, formats, and outputs
 including console, file, and rotation support.
 """
 
+import json
 import logging
-import logging.handlers
+import os
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
 from functools import lru_cache
 
-from ..config.settings import get_settings
-
 
 class ColoredFormatter(logging.Formatter):
     """Colored log formatter for console output."""
@@ -28,20 +27,38 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'      # Reset
     }
 
+    def __init__(self, *args, **kwargs):
+        """Initialize formatter and precompose colored level names."""
+        super().__init__(*args, **kwargs)
+        reset = self.COLORS['RESET']
+        self._colored_levelnames = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items()
+            if level != 'RESET'
+        }
+
     def format(self, record):
         """Format log record with colors."""
-        if hasattr(record, 'levelname') and record.levelname in self.COLORS:
-            # Add color to levelname
-            original_levelname = record.levelname
-            record.levelname = f"{self.COLORS[record.levelname]}{original_levelname}{self.COLORS['RESET']}"
+        original_levelname = record.levelname
+        colored = self._colored_levelnames.get(original_levelname)
+        if colored is None:
+            return super().format(record)
 
-        formatted = super().format(record)
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            # Restore original levelname for other handlers
+            record.levelname = original_levelname
 
-        # Restore original levelname
-        if hasattr(record, 'levelname'):
-            record.levelname = original_levelname.split()[-1]  # Remove color codes
 
-        return formatted
+@lru_cache(maxsize=1)
+def _console_supports_color() -> bool:
+    """Check once per process whether console output should be colored."""
+    stream = sys.stdout
+    if stream is None or not hasattr(stream, 'isatty'):
+        return False
+    return stream.isatty() and 'NO_COLOR' not in os.environ
 
 
 class StructuredFormatter(logging.Formatter):
@@ -68,12 +85,7 @@ class StructuredFormatter(logging.Formatter):
 
     def _to_json(self, data: Dict[str, Any]) -> str:
         """Convert data to JSON string."""
-        try:
-            import json
-            return json.dumps(data, ensure_ascii=False, default=str)
-        except ImportError:
-            # Fallback to simple string representation
-            return str(data)
+        return json.dumps(data, ensure_ascii=False, default=str)
 
 
 @lru_cache()
@@ -86,6 +98,7 @@ def setup_logger(name: str, settings: Optional[Any] = None) -> logging.Logger:
     """Set up logger with configuration."""
     if settings is None:
         try:
+            from ..config.settings import get_settings
             settings = get_settings()
         except Exception:
             # Use default settings if configuration not available
@@ -113,17 +126,24 @@ def setup_logger(name: str, settings: Optional[Any] = None) -> logging.Logger:
     console_handler.setLevel(level)
 
     # Use colored formatter for console
-    console_formatter = ColoredFormatter(settings.logging.format)
+    if _console_supports_color():
+        console_formatter = ColoredFormatter(settings.logging.format)
+    else:
+        console_formatter = logging.Formatter(settings.logging.format)
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
 
     # File handler (if configured)
     if settings.logging.file_path:
         try:
+            # Imported only when file logging is configured; logging.handlers
+            # pulls in socket/pickle/queue, which console-only runs never need
+            from logging.handlers import RotatingFileHandler
+
             log_file = Path(settings.logging.file_path)
             log_file.parent.mkdir(parents=True, exist_ok=True)
 
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = RotatingFileHandler(
                 log_file,
                 maxBytes=settings.logging.max_file_size,
                 backupCount=settings.logging.backup_count,
@@ -160,6 +180,7 @@ def configure_logging(settings: Optional[Any] = None):
 
     if settings is None:
         try:
+            from ..config.settings import get_settings
             settings = get_settings()
         except Exception:
             settings = type('Settings', (), {
@@ -179,17 +200,22 @@ def configure_logging(settings: Optional[Any] = None):
     # Console handler for root
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_formatter = ColoredFormatter(settings.logging.format)
+    if _console_supports_color():
+        console_formatter = ColoredFormatter(settings.logging.format)
+    else:
+        console_formatter = logging.Formatter(settings.logging.format)
     console_handler.setFormatter(console_formatter)
     root_logger.addHandler(console_handler)
 
     # File handler for root (if configured)
     if settings.logging.file_path:
         try:
+            from logging.handlers import RotatingFileHandler
+
             log_file = Path(settings.logging.file_path)
             log_file.parent.mkdir(parents=True, exist_ok=True)
 
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = RotatingFileHandler(
                 log_file,
                 maxBytes=settings.logging.max_file_size,
                 backupCount=settings.logging.backup_count,
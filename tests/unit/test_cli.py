@@ -0,0 +1,77 @@
+"""
+Unit tests for the command-line interface.
+"""
+
+import sys
+from unittest.mock import Mock, patch
+
+from click.testing import CliRunner
+
+from email_priority_manager.cli.main import cli
+
+
+def _mock_settings() -> Mock:
+    """Build a settings object with the fields the CLI reads."""
+    settings = Mock()
+    settings.environment = "testing"
+    settings.debug = False
+    settings.version = "0.1.0"
+    settings.data_dir = "data"
+    settings.log_dir = "logs"
+    settings.database.path = "missing.db"
+    settings.email = None
+    settings.ai = None
+    settings.logging.level = "INFO"
+    settings.logging.format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    settings.logging.file_path = None
+    return settings
+
+
+class TestStatusCommand:
+    """Test cases for the status command."""
+
+    def test_status_stdout_contains_only_report(self):
+        """Test that log records do not end up in the status report."""
+        secrets_manager = Mock()
+        secrets_manager.list_secrets.return_value = {"general": ["token"]}
+
+        with patch('email_priority_manager.config.settings.get_settings',
+                   return_value=_mock_settings()), \
+             patch('email_priority_manager.config.secrets.get_secrets_manager',
+                   return_value=secrets_manager):
+            result = CliRunner().invoke(cli, ['status'])
+
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == [
+            "Email Priority Manager Status",
+            "=" * 40,
+            "Environment: testing",
+            "Debug Mode: False",
+            "Version: 0.1.0",
+            "",
+            "Configuration:",
+            "  Config Directory: default",
+            "  Data Directory: data",
+            "  Log Directory: logs",
+            "  Database: missing.db (✗)",
+            "  Email Configured: ✗",
+            "  AI Configured: ✗",
+            "  Secrets Stored: 1",
+        ]
+
+
+class TestTestCommands:
+    """Test cases for the test command group."""
+
+    def test_all_runs_pytest_in_fresh_interpreter(self):
+        """Test that 'test all' runs coverage in a separate process."""
+        with patch('email_priority_manager.config.settings.get_settings',
+                   return_value=_mock_settings()), \
+             patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(returncode=3)
+            result = CliRunner().invoke(cli, ['test', 'all'])
+
+        assert result.exit_code == 3
+        args = mock_run.call_args[0][0]
+        assert args[:3] == [sys.executable, "-m", "pytest"]
+        assert "--cov=src/email_priority_manager" in args
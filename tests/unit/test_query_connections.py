@@ -0,0 +1,113 @@
+"""
+Unit tests for connection handling in EmailQueries and EmailSearch.
+
+The modules are loaded from their files because importing the
+email_priority_manager.database package also imports its migrations.
+"""
+
+import importlib.util
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+DATABASE_DIR = Path(__file__).parent.parent.parent / "src" / "email_priority_manager" / "database"
+
+
+def _load_module(name: str):
+    """Load a module from the database package directory by file name."""
+    module_name = f"epm_database_{name}"
+    spec = importlib.util.spec_from_file_location(module_name, DATABASE_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def database_modules():
+    """Load the schema, queries and search modules."""
+    return _load_module("schema"), _load_module("queries"), _load_module("search")
+
+
+@pytest.fixture
+def db_path(tmp_path, database_modules):
+    """Create a database with the full schema and a few test emails."""
+    schema, _, _ = database_modules
+    path = str(tmp_path / "test.db")
+
+    with sqlite3.connect(path) as conn:
+        for _, statement in schema.get_all_create_statements():
+            conn.executescript(statement)
+        for i in range(5):
+            conn.execute(
+                "INSERT INTO emails (message_id, subject, sender, recipients, body_text, received_at) "
+                "VALUES (?, ?, ?, ?, ?, datetime('now'))",
+                (f"msg{i}@example.com", f"Project update {i}", "john@example.com",
+                 "team@example.com", "Weekly project status")
+            )
+
+    return path
+
+
+def _run_in_threads(func, count: int = 2):
+    """Call func from several threads and return (results, errors)."""
+    results = []
+    errors = []
+
+    def worker():
+        try:
+            results.append(func())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results, errors
+
+
+class TestConnectionHandling:
+    """Test cases for per-call connections."""
+
+    def test_queries_usable_from_multiple_threads(self, database_modules, db_path):
+        """Test that one EmailQueries instance can be used from several threads."""
+        _, queries, _ = database_modules
+        email_queries = queries.EmailQueries(db_path)
+
+        results, errors = _run_in_threads(
+            lambda: email_queries.get_email_statistics()["total_emails"]
+        )
+
+        assert errors == []
+        assert results == [5, 5]
+
+    def test_search_usable_from_multiple_threads(self, database_modules, db_path):
+        """Test that one EmailSearch instance can be used from several threads."""
+        _, _, search = database_modules
+        email_search = search.EmailSearch(db_path)
+
+        results, errors = _run_in_threads(
+            lambda: email_search.get_search_suggestions("Project")
+        )
+
+        assert errors == []
+        assert len(results) == 2
+        assert results[0] == results[1]
+        assert len(results[0]) > 0
+
+    def test_connection_closed_after_call(self, database_modules, db_path):
+        """Test that the per-call connection is closed on exit."""
+        _, queries, _ = database_modules
+        email_queries = queries.EmailQueries(db_path)
+
+        with email_queries._get_connection() as conn:
+            conn.execute("SELECT 1")
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -0,0 +1,121 @@
+"""
+Unit tests for SecretsManager caching.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from email_priority_manager.config.secrets import (
+    SecretsError,
+    SecretsManager,
+    get_secrets_manager,
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a secrets manager in a fresh directory."""
+    return SecretsManager(str(tmp_path / "secrets"))
+
+
+def _write_externally(manager, data):
+    """Rewrite the secrets file as another process would."""
+    previous = manager._secrets_file.stat().st_mtime_ns
+    manager._secrets_file.write_bytes(
+        manager._fernet.encrypt(json.dumps(data).encode())
+    )
+    # Make sure the change is visible even on coarse-mtime filesystems
+    os.utime(manager._secrets_file, ns=(previous + 10**9, previous + 10**9))
+
+
+class TestSecretsCache:
+    """Test cases for the decrypted secrets cache."""
+
+    def test_store_writes_through_cache(self, manager):
+        """Test that reads after a store are served without decrypting."""
+        manager.store_secret("token", "value", "general")
+
+        with patch.object(manager._fernet, "decrypt",
+                          wraps=manager._fernet.decrypt) as decrypt:
+            assert manager.list_secrets() == {"general": ["token"]}
+            assert manager.list_secrets("general") == {"general": ["token"]}
+            assert decrypt.call_count == 0
+
+            # get_secret still decrypts the value itself, but not the file
+            assert manager.get_secret("token", "general") == "value"
+            assert decrypt.call_count == 1
+
+    def test_delete_writes_through_cache(self, manager):
+        """Test that deletes are reflected by subsequent reads."""
+        manager.store_secret("a", "1")
+        manager.store_secret("b", "2")
+        manager.delete_secret("a")
+
+        assert manager.list_secrets() == {"general": ["b"]}
+        assert manager.get_secret("a") is None
+
+    def test_external_write_invalidates_cache(self, manager):
+        """Test that a change to the file on disk is picked up."""
+        manager.store_secret("a", "1")
+        data = manager._load_secrets_data()
+        data["general"]["c"] = data["general"]["a"]
+
+        _write_externally(manager, data)
+
+        assert manager.list_secrets() == {"general": ["a", "c"]}
+        assert manager.get_secret("c") == "1"
+
+    def test_loaded_data_is_a_copy(self, manager):
+        """Test that callers cannot mutate the cached secrets."""
+        manager.store_secret("a", "1")
+
+        data = manager._load_secrets_data()
+        data["general"]["injected"] = "x"
+        data["other"] = {}
+
+        assert manager.list_secrets() == {"general": ["a"]}
+
+    def test_failed_save_resets_cache(self, manager):
+        """Test that a failed save does not leave unsaved data cached."""
+        manager.store_secret("a", "1")
+
+        with patch("email_priority_manager.config.secrets.os.chmod",
+                   side_effect=OSError("denied")):
+            with pytest.raises(SecretsError):
+                manager.store_secret("b", "2")
+
+        assert manager._secrets_cache is None
+        # The reload reflects what is actually on disk
+        assert "a" in manager.list_secrets()["general"]
+
+
+class TestGetSecretsManager:
+    """Test cases for get_secrets_manager."""
+
+    def setup_method(self):
+        """Start each test with an empty manager cache."""
+        get_secrets_manager.cache_clear()
+
+    def teardown_method(self):
+        """Do not leak managers into other tests."""
+        get_secrets_manager.cache_clear()
+
+    def test_returns_cached_instance(self, tmp_path):
+        """Test that the same directory yields the same manager."""
+        secrets_dir = str(tmp_path / "secrets")
+
+        first = get_secrets_manager(secrets_dir)
+
+        assert get_secrets_manager(secrets_dir) is first
+        assert get_secrets_manager.cache_info().hits == 1
+
+    def test_distinct_directories_get_distinct_managers(self, tmp_path):
+        """Test that each secrets directory has its own manager."""
+        first = get_secrets_manager(str(tmp_path / "one"))
+        second = get_secrets_manager(str(tmp_path / "two"))
+
+        assert first is not second
+        assert first.secrets_dir != second.secrets_dir
@@ -0,0 +1,136 @@
+"""
+Unit tests for the development setup script.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+SETUP_SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "setup.py"
+
+
+@pytest.fixture(scope="module")
+def setup_script():
+    """Load scripts/setup.py as a module."""
+    spec = importlib.util.spec_from_file_location("epm_setup_script", SETUP_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestRunSteps:
+    """Test cases for run_steps."""
+
+    def test_dependencies_run_first(self, setup_script):
+        """Test that a step only runs after all of its dependencies."""
+        calls = []
+        lock = threading.Lock()
+
+        def step(name):
+            def run():
+                with lock:
+                    calls.append(name)
+                return True
+            return run
+
+        steps = [
+            ("install", step("install"), ("venv",)),
+            ("venv", step("venv"), ()),
+            ("dirs", step("dirs"), ("install",)),
+            ("env", step("env"), ("install",)),
+            ("validate", step("validate"), ("dirs", "env")),
+        ]
+
+        assert setup_script.run_steps(steps) == []
+        assert calls[:2] == ["venv", "install"]
+        assert set(calls[2:4]) == {"dirs", "env"}
+        assert calls[4] == "validate"
+
+    def test_unresolvable_dependencies_fail(self, setup_script):
+        """Test that steps with missing dependencies are reported, not run."""
+        calls = []
+
+        steps = [
+            ("first", lambda: calls.append("first") or True, ()),
+            ("orphan", lambda: calls.append("orphan") or True, ("missing",)),
+        ]
+
+        assert setup_script.run_steps(steps) == ["orphan"]
+        assert calls == ["first"]
+
+    def test_failures_reported_in_declaration_order(self, setup_script):
+        """Test that concurrent failures are listed in declaration order."""
+        def slow_failure():
+            time.sleep(0.05)
+            return False
+
+        def raises():
+            raise RuntimeError("boom")
+
+        steps = [
+            ("slow", slow_failure, ()),
+            ("ok", lambda: True, ()),
+            ("raises", raises, ()),
+        ]
+
+        assert setup_script.run_steps(steps) == ["slow", "raises"]
+
+    def test_concurrent_output_not_interleaved(self, setup_script, capsys):
+        """Test that concurrent steps' output is printed per step, in order."""
+        def slow_step():
+            print("slow: start")
+            time.sleep(0.05)
+            print("slow: end")
+            return True
+
+        def command_step():
+            return setup_script.run_command(
+                [sys.executable, "-c", "print('from subprocess')"], "command"
+            )
+
+        steps = [
+            ("slow", slow_step, ()),
+            ("command", command_step, ()),
+        ]
+
+        assert setup_script.run_steps(steps) == []
+
+        output = capsys.readouterr().out
+        assert output.startswith("slow: start\nslow: end\n")
+        assert output.index("slow: end") < output.index("Setting up: command")
+        assert output.index("from subprocess") < output.index(
+            "✓ command completed successfully"
+        )
+
+
+class TestRunCommand:
+    """Test cases for run_command."""
+
+    def test_banner_precedes_child_output_when_piped(self):
+        """Test that the banner is flushed before the child inherits stdout."""
+        script = (
+            "import importlib.util, sys\n"
+            f"spec = importlib.util.spec_from_file_location('s', {str(SETUP_SCRIPT)!r})\n"
+            "module = importlib.util.module_from_spec(spec)\n"
+            "spec.loader.exec_module(module)\n"
+            "module.run_command([sys.executable, '-c', 'print(\\'CHILD OUTPUT\\')'], 'child')\n"
+        )
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONUNBUFFERED"}
+
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            stdout=subprocess.PIPE,
+            text=True,
+            env=env,
+            check=True
+        )
+
+        output = result.stdout
+        assert output.index("Setting up: child") < output.index("CHILD OUTPUT")
+        assert output.index("CHILD OUTPUT") < output.index("✓ child completed successfully")